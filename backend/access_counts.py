@@ -0,0 +1,75 @@
+"""Buffered relic access counting."""
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Iterable
+from sqlalchemy import update, bindparam, func
+from backend.database import SessionLocal
+from backend.models import Relic
+
+logger = logging.getLogger('relic.access_counts')
+
+# Access count increments buffered in-process and flushed periodically,
+# so reads don't issue an UPDATE + COMMIT per request.
+_pending_access_counts: Counter = Counter()
+_access_lock = threading.Lock()
+
+
+def record_relic_access(relic_id: str) -> None:
+    """Buffer one access for a relic until the next flush."""
+    with _access_lock:
+        _pending_access_counts[relic_id] += 1
+
+
+def get_access_counts(relics: Iterable[Relic]) -> Dict[str, int]:
+    """Return each relic's access count, including buffered accesses not yet flushed."""
+    with _access_lock:
+        return {
+            relic.id: (relic.access_count or 0) + _pending_access_counts.get(relic.id, 0)
+            for relic in relics
+        }
+
+
+def get_access_count(relic: Relic) -> int:
+    """Return a relic's access count, including buffered accesses not yet flushed."""
+    return get_access_counts([relic])[relic.id]
+
+
+def flush_access_counts() -> int:
+    """
+    Write buffered access counts to the database.
+
+    All deltas are applied in a single executemany UPDATE. If the write fails,
+    the deltas are merged back into the buffer for the next flush.
+
+    Returns:
+        Number of relics updated
+    """
+    global _pending_access_counts
+
+    with _access_lock:
+        if not _pending_access_counts:
+            return 0
+        pending = _pending_access_counts
+        _pending_access_counts = Counter()
+
+    relic_table = Relic.__table__
+    stmt = (
+        update(relic_table)
+        .where(relic_table.c.id == bindparam('b_id'))
+        .values(access_count=func.coalesce(relic_table.c.access_count, 0) + bindparam('b_delta'))
+    )
+
+    db = SessionLocal()
+    try:
+        db.execute(stmt, [{'b_id': relic_id, 'b_delta': delta} for relic_id, delta in pending.items()])
+        db.commit()
+        return len(pending)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to flush access counts: {e}")
+        with _access_lock:
+            _pending_access_counts.update(pending)
+        return 0
+    finally:
+        db.close()
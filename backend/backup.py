@@ -73,7 +73,7 @@ async def perform_backup(backup_type: str = 'scheduled') -> bool:
 
             # Compress with gzip
             logger.debug("Compressing backup...")
-            compressed = gzip.compress(stdout, compresslevel=9)
+            compressed = await asyncio.to_thread(gzip.compress, stdout, compresslevel=9)
             compression_ratio = (1 - len(compressed) / len(stdout)) * 100 if len(stdout) > 0 else 0
 
             # Generate filename and upload to S3
@@ -353,7 +353,7 @@ async def perform_restore(filename: str, engine) -> dict:
 
     logger.info(f"Downloading backup from S3: db/{filename}")
     compressed = await storage_service.download(f"db/{filename}")
-    sql_bytes = gzip.decompress(compressed)
+    sql_bytes = await asyncio.to_thread(gzip.decompress, compressed)
     logger.info(f"Decompressed {len(compressed):,} -> {len(sql_bytes):,} bytes")
 
     psql_result = await _run_restore(sql_bytes, engine, label=filename)
@@ -367,7 +367,7 @@ async def perform_restore_upload(compressed: bytes, original_filename: str, engi
     Note: After restore, the DB reflects the backup's Alembic migration state.
     The service does NOT auto-run 'alembic upgrade head'.
     """
-    sql_bytes = gzip.decompress(compressed)
+    sql_bytes = await asyncio.to_thread(gzip.decompress, compressed)
     logger.info(f"Decompressed upload {original_filename}: {len(compressed):,} -> {len(sql_bytes):,} bytes")
 
     psql_result = await _run_restore(sql_bytes, engine, label=original_filename)
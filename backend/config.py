@@ -23,6 +23,7 @@ class Settings(BaseSettings):
     S3_SECRET_KEY: str = os.getenv("S3_SECRET_KEY") or os.getenv("MINIO_SECRET_KEY", "minioadmin")
     S3_BUCKET_NAME: str = os.getenv("S3_BUCKET_NAME") or os.getenv("MINIO_BUCKET", "relics")
     S3_REGION: str = os.getenv("S3_REGION", "us-east-1")
+    STORAGE_COMPRESSION_ENABLED: bool = os.getenv("STORAGE_COMPRESSION_ENABLED", "true").lower() == "true"
 
     # Upload limits
     MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024 * 1024  # 50 GB
@@ -42,8 +43,12 @@ class Settings(BaseSettings):
 
     # Admin Configuration
     RELIC_CLEANUP_INTERVAL: int = int(os.getenv("RELIC_CLEANUP_INTERVAL", "60"))  # Minutes
+    RELIC_CLEANUP_BATCH_SIZE: int = int(os.getenv("RELIC_CLEANUP_BATCH_SIZE", "1000"))  # Relics per cleanup batch
     ADMIN_CLIENT_IDS: str = os.getenv("ADMIN_CLIENT_IDS", "")
 
+    # Access counting
+    ACCESS_COUNT_FLUSH_INTERVAL: int = int(os.getenv("ACCESS_COUNT_FLUSH_INTERVAL", "10"))  # Seconds
+
     # CORS - accept as string from env, parse in validator
     ALLOWED_ORIGINS: str = '["http://localhost:3000", "http://localhost:8000"]'
 
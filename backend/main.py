@@ -8,6 +8,7 @@ from backend.database import init_db
 from backend.storage import storage_service
 from backend.backup import perform_backup
 from backend.scheduler import start_scheduler, shutdown_scheduler
+from backend.access_counts import flush_access_counts
 
 from backend.routes import health, clients, relics, bookmarks, comments, spaces, reports, admin
 
@@ -58,6 +59,9 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
+    # Persist any buffered access counts
+    flush_access_counts()
+
     if settings.BACKUP_ENABLED:
         # Create backup on shutdown
         if settings.BACKUP_ON_SHUTDOWN:
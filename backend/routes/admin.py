@@ -14,6 +14,7 @@ from backend.models import Relic, ClientKey, ClientBookmark, RelicReport, Commen
 from backend.storage import storage_service
 from backend.dependencies import get_client_key, get_admin_client, is_admin_client
 from backend.utils import get_fork_counts, clamp_limit, apply_relic_search
+from backend.access_counts import get_access_counts
 
 router = APIRouter(prefix="/api/v1/admin")
 
@@ -86,6 +87,7 @@ async def admin_list_all_relics(
             ).group_by(Comment.relic_id).all()
         }
     forks_counts = get_fork_counts(db, relic_ids)
+    access_counts = get_access_counts(relics)
 
     return {
         "total": total,
@@ -100,7 +102,7 @@ async def admin_list_all_relics(
                 "content_type": r.content_type,
                 "size_bytes": r.size_bytes,
                 "access_level": r.access_level,
-                "access_count": r.access_count,
+                "access_count": access_counts[r.id],
                 "bookmark_count": r.bookmark_count,
                 "comments_count": comments_counts.get(r.id, 0),
                 "forks_count": forks_counts.get(r.id, 0),
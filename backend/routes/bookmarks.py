@@ -9,6 +9,7 @@ from backend.database import get_db
 from backend.models import Relic, ClientBookmark, Comment, ClientKey, Tag
 from backend.dependencies import get_client_key
 from backend.utils import get_fork_counts, clamp_limit, apply_relic_search, relic_sort_order
+from backend.access_counts import get_access_counts
 
 router = APIRouter(prefix="/api/v1/bookmarks")
 
@@ -193,6 +194,7 @@ async def get_client_bookmarks(
             ).group_by(Comment.relic_id).all()
         }
     forks_counts = get_fork_counts(db, relic_ids)
+    access_counts = get_access_counts([relic for _, relic in bookmarks])
 
     return {
         "client_id": client.id,
@@ -208,7 +210,7 @@ async def get_client_bookmarks(
                 "size_bytes": relic.size_bytes,
                 "created_at": relic.created_at,
                 "access_level": relic.access_level,
-                "access_count": relic.access_count,
+                "access_count": access_counts[relic.id],
                 "bookmark_count": relic.bookmark_count,
                 "comments_count": comments_counts.get(relic.id, 0),
                 "forks_count": forks_counts.get(relic.id, 0),
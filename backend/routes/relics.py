@@ -1,11 +1,12 @@
 """Relic CRUD and content endpoints."""
 from fastapi import APIRouter, Request, Depends, UploadFile, File, Form, HTTPException
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session, selectinload, joinedload, contains_eager
-from sqlalchemy import func, or_
+from sqlalchemy.orm import Session, selectinload, joinedload, contains_eager, aliased
+from sqlalchemy import func, or_, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import datetime
 from typing import Optional, List
+import asyncio
 import logging
 import urllib.parse
 
@@ -14,7 +15,8 @@ from backend.database import get_db
 from backend.models import Relic, ClientKey, Tag, Space, Comment, RelicAccess, space_relics
 from backend.schemas import RelicResponse, RelicListResponse, RelicUpdate, RelicAccessAdd, RelicAccessEntry
 from backend.storage import storage_service
-from backend.utils import parse_expiry_string, is_expired, hash_password, get_fork_count, get_fork_counts, clamp_limit, like_term, apply_relic_search, relic_sort_order
+from backend.access_counts import record_relic_access, get_access_count, get_access_counts
+from backend.utils import parse_expiry_string, is_expired, accepts_gzip, verify_password, get_fork_count, get_fork_counts, clamp_limit, like_term, apply_relic_search, relic_sort_order
 from backend.dependencies import (
     get_client_key, get_or_create_client_key, check_ownership_or_admin,
     process_tags, generate_unique_relic_id, check_space_access
@@ -26,6 +28,22 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+async def _discard_stored_content(store_task: asyncio.Task, s3_key: str) -> None:
+    """
+    Remove the object written by a background store whose relic was not committed.
+
+    The storage call runs in a worker thread and cannot be cancelled, so wait
+    for it to settle (retrieving any exception) before deleting what it wrote.
+    """
+    result, = await asyncio.gather(store_task, return_exceptions=True)
+    if isinstance(result, BaseException):
+        return
+    try:
+        await storage_service.delete(s3_key)
+    except Exception as e:
+        logger.warning(f"Failed to remove orphaned object {s3_key}: {e}")
+
+
 @router.post("/api/v1/relics", response_model=dict)
 async def create_relic(
     request: Request,
@@ -57,6 +75,7 @@ async def create_relic(
 
     # Get or create client
     client = get_or_create_client_key(request, db)
+    upload_task = None
 
     try:
         # Read file content
@@ -76,9 +95,9 @@ async def create_relic(
         # Generate unique relic ID with collision handling
         relic_id = generate_unique_relic_id(db)
 
-        # Upload to storage
+        # Upload to storage in the background while the DB rows are prepared
         s3_key = f"relics/{relic_id}"
-        await storage_service.upload(s3_key, content, content_type)
+        upload_task = asyncio.create_task(storage_service.upload(s3_key, content, content_type))
 
         # Parse expiry
         expires_at = parse_expiry_string(expires_in)
@@ -87,6 +106,7 @@ async def create_relic(
         tag_objects = process_tags(db, tags) if tags else []
 
         # Create relic record
+        created_at = datetime.utcnow()
         relic = Relic(
             id=relic_id,
             client_id=client.id if client else None,
@@ -96,7 +116,7 @@ async def create_relic(
             size_bytes=len(content),
             s3_key=s3_key,
             access_level=access_level,
-            created_at=datetime.utcnow(),
+            created_at=created_at,
             expires_at=expires_at
         )
 
@@ -117,20 +137,24 @@ async def create_relic(
                 db.flush()
                 db.execute(pg_insert(space_relics).values(space_id=space.id, relic_id=relic.id).on_conflict_do_nothing())
 
+        # Only commit once the content is safely stored
+        await upload_task
         db.commit()
-        db.refresh(relic)
 
+        # Build the response from known values; no refresh SELECT needed
         return {
-            "id": relic.id,
-            "url": f"/{relic.id}",
-            "created_at": relic.created_at,
-            "size_bytes": relic.size_bytes
+            "id": relic_id,
+            "url": f"/{relic_id}",
+            "created_at": created_at,
+            "size_bytes": len(content)
         }
 
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
+        if upload_task:
+            await _discard_stored_content(upload_task, s3_key)
         logger.error(f"Operation failed: {e}")
         raise HTTPException(status_code=500, detail="An internal error occurred")
 
@@ -162,7 +186,7 @@ async def get_relic(
     if relic.password_hash:
         if not password:
             raise HTTPException(status_code=403, detail="This relic requires a password")
-        if hash_password(password) != relic.password_hash:
+        if not await asyncio.to_thread(verify_password, password, relic.password_hash):
             raise HTTPException(status_code=403, detail="Invalid password")
 
     # Check if client can edit
@@ -176,22 +200,29 @@ async def get_relic(
                 raise HTTPException(status_code=403, detail="Access restricted")
     relic.can_edit = check_ownership_or_admin(relic, client, require_auth=False)
 
-    # Increment access count
-    relic.access_count += 1
-    db.commit()
+    # Increment access count (buffered, flushed by the scheduler)
+    record_relic_access(relic_id)
 
     # Calculate counts
     comments_count = db.query(func.count(Comment.id)).filter(Comment.relic_id == relic_id).scalar()
     relic_response = RelicResponse.from_orm(relic)
+    relic_response.access_count = get_access_count(relic)
     relic_response.comments_count = comments_count or 0
     relic_response.forks_count = get_fork_count(db, relic_id)
     return relic_response
 
+
 @router.get("/{relic_id}")
 @router.get("/{relic_id}/raw")
 async def get_relic_raw(relic_id: str, request: Request, password: Optional[str] = None, db: Session = Depends(get_db)):
     """Get raw relic content."""
-    relic = db.query(Relic).options(selectinload(Relic.access_list)).filter(Relic.id == relic_id).first()
+    # Only the scalar columns needed to check access and stream the content
+    relic = db.execute(
+        select(
+            Relic.id, Relic.client_id, Relic.name, Relic.content_type, Relic.s3_key,
+            Relic.access_level, Relic.password_hash, Relic.expires_at
+        ).where(Relic.id == relic_id)
+    ).first()
 
     if not relic:
         raise HTTPException(status_code=404, detail="Relic not found")
@@ -203,25 +234,38 @@ async def get_relic_raw(relic_id: str, request: Request, password: Optional[str]
     if relic.password_hash:
         if not password:
             raise HTTPException(status_code=403, detail="This relic requires a password")
-        if hash_password(password) != relic.password_hash:
+        if not await asyncio.to_thread(verify_password, password, relic.password_hash):
             raise HTTPException(status_code=403, detail="Invalid password")
 
     # Enforce restricted access
     if relic.access_level == "restricted":
         client = get_client_key(request, db)
         if not check_ownership_or_admin(relic, client, require_auth=False):
-            allowed_ids = {a.client_id for a in relic.access_list}
-            if not client or client.id not in allowed_ids:
+            allowed = client and db.query(RelicAccess.id).filter(
+                RelicAccess.relic_id == relic_id,
+                RelicAccess.client_id == client.id
+            ).first()
+            if not allowed:
                 raise HTTPException(status_code=403, detail="Access restricted")
 
     try:
-        content = await storage_service.download(relic.s3_key)
+        # Pass gzip-stored content through untouched when the client accepts it
+        gzip_ok = accepts_gzip(request.headers.get("accept-encoding"))
+        chunks, stored_encoding = await storage_service.stream(relic.s3_key, decode=not gzip_ok)
+
+        headers = {"Content-Disposition": "inline; filename*=UTF-8''{filename}".format(
+            filename=urllib.parse.quote(relic.name or relic.id, safe="")
+        )}
+        if stored_encoding:
+            # The body depends on Accept-Encoding whether or not it was passed through
+            headers["Vary"] = "Accept-Encoding"
+            if gzip_ok:
+                headers["Content-Encoding"] = stored_encoding
+
         return StreamingResponse(
-            iter([content]),
+            chunks,
             media_type=relic.content_type,
-            headers={"Content-Disposition": "inline; filename*=UTF-8''{filename}".format(
-                filename=urllib.parse.quote(relic.name or relic.id, safe="")
-            )}
+            headers=headers
         )
     except Exception as e:
         logger.error(f"Operation failed: {e}")
@@ -269,7 +313,7 @@ async def fork_relic(
         password = request.headers.get("X-Relic-Password")
         if not password:
             raise HTTPException(status_code=403, detail="This relic requires a password")
-        if hash_password(password) != original.password_hash:
+        if not await asyncio.to_thread(verify_password, password, original.password_hash):
             raise HTTPException(status_code=403, detail="Invalid password")
 
     # Enforce restricted access
@@ -279,21 +323,23 @@ async def fork_relic(
             if not client or client.id not in allowed_ids:
                 raise HTTPException(status_code=403, detail="Access restricted")
 
+    store_task = None
     try:
-        # If no new content provided, fork with same content
+        # Generate unique new ID with collision handling
+        new_id = generate_unique_relic_id(db)
+        s3_key = f"relics/{new_id}"
+
+        # If no new content provided, copy the original object server-side.
+        # Storage runs in the background while the DB rows are prepared.
         if file:
             content = await file.read()
             content_type = file.content_type or original.content_type
+            size_bytes = len(content)
+            store_task = asyncio.create_task(storage_service.upload(s3_key, content, content_type))
         else:
-            content = await storage_service.download(original.s3_key)
             content_type = original.content_type
-
-        # Generate unique new ID with collision handling
-        new_id = generate_unique_relic_id(db)
-
-        # Upload to storage
-        s3_key = f"relics/{new_id}"
-        await storage_service.upload(s3_key, content, content_type)
+            size_bytes = original.size_bytes
+            store_task = asyncio.create_task(storage_service.copy(original.s3_key, s3_key))
 
         # Calculate expiry date if provided
         expires_at = None
@@ -307,16 +353,18 @@ async def fork_relic(
             tag_objects = list(original.tags)
 
         # Create fork
+        created_at = datetime.utcnow()
         fork = Relic(
             id=new_id,
             client_id=client.id if client else None,  # Fork belongs to client if provided
             name=name or original.name,
             content_type=content_type,
             language_hint=original.language_hint,
-            size_bytes=len(content),
+            size_bytes=size_bytes,
             s3_key=s3_key,
             fork_of=relic_id,
             access_level=access_level or original.access_level,
+            created_at=created_at,
             expires_at=expires_at
         )
 
@@ -329,18 +377,22 @@ async def fork_relic(
             client.relic_count += 1
 
         db.add(fork)
+
+        # Only commit once the content is safely stored
+        await store_task
         db.commit()
-        db.refresh(fork)
 
         return {
-            "id": fork.id,
-            "url": f"/{fork.id}",
-            "fork_of": fork.fork_of,
-            "created_at": fork.created_at
+            "id": new_id,
+            "url": f"/{new_id}",
+            "fork_of": relic_id,
+            "created_at": created_at
         }
 
     except Exception as e:
         db.rollback()
+        if store_task:
+            await _discard_stored_content(store_task, s3_key)
         logger.error(f"Operation failed: {e}")
         raise HTTPException(status_code=500, detail="An internal error occurred")
 
@@ -349,25 +401,28 @@ async def fork_relic(
 async def get_relic_lineage(relic_id: str, max_nodes: int = 200, db: Session = Depends(get_db)):
     """Get the fork lineage tree for a relic."""
     max_nodes = min(max(max_nodes, 1), 5000)
-    current = db.query(Relic).filter(Relic.id == relic_id).first()
-    if not current:
-        raise HTTPException(status_code=404, detail="Relic not found")
 
-    # Walk up to root — O(depth) queries, typically very shallow
-    visited_up = set()
-    root_id = current.id
-    current_relic = current
-    while current_relic.fork_of and current_relic.fork_of not in visited_up:
-        visited_up.add(current_relic.fork_of)
-        parent = db.query(Relic).filter(Relic.id == current_relic.fork_of).first()
-        if not parent:
-            break
-        root_id = parent.id
-        current_relic = parent
+    # Walk up to root with a single recursive query. UNION (not UNION ALL)
+    # de-duplicates rows, so a fork_of cycle terminates.
+    ancestors = (
+        select(Relic.id, Relic.fork_of)
+        .where(Relic.id == relic_id)
+        .cte("ancestors", recursive=True)
+    )
+    parent = aliased(Relic)
+    ancestors = ancestors.union(
+        select(parent.id, parent.fork_of).join(ancestors, parent.id == ancestors.c.fork_of)
+    )
+    lineage_up = {r.id: r for r in db.query(Relic).join(ancestors, Relic.id == ancestors.c.id).all()}
+    if relic_id not in lineage_up:
+        raise HTTPException(status_code=404, detail="Relic not found")
 
-    root_relic_obj = db.query(Relic).filter(Relic.id == root_id).first()
-    if not root_relic_obj:
-        return {"current_relic_id": relic_id, "root": None, "total_nodes": 0, "truncated": False}
+    # Root is the topmost relic still present (its parent is unset or deleted)
+    root_relic_obj = next(
+        (r for r in lineage_up.values() if not r.fork_of or r.fork_of not in lineage_up),
+        lineage_up[relic_id]
+    )
+    root_id = root_relic_obj.id
 
     tree_nodes = {
         root_id: {"id": root_relic_obj.id, "name": root_relic_obj.name, "created_at": root_relic_obj.created_at, "children": []}
@@ -532,12 +587,14 @@ async def list_relics(
             ).group_by(Comment.relic_id).all()
         }
     forks_counts = get_fork_counts(db, relic_ids)
+    access_counts = get_access_counts(relics)
 
     relic_responses = []
     for relic in relics:
         relic_response = RelicResponse.from_orm(relic)
         relic_response.comments_count = comments_counts.get(relic.id, 0)
         relic_response.forks_count = forks_counts.get(relic.id, 0)
+        relic_response.access_count = access_counts[relic.id]
         relic_responses.append(relic_response)
 
     return {"relics": relic_responses, "total": total, "limit": limit, "offset": offset}
@@ -14,6 +14,7 @@ from backend.schemas import (
     SpaceAccessBase, SpaceAccessResponse, SpaceTransferOwnership
 )
 from backend.utils import generate_relic_id, get_fork_counts, clamp_limit, like_term, apply_relic_search, relic_sort_order
+from backend.access_counts import get_access_counts
 from backend.dependencies import get_space_role, check_space_access, get_space_relic_count
 
 router = APIRouter(prefix="/api/v1/spaces")
@@ -380,6 +381,7 @@ async def get_space_relics(
             ).group_by(Comment.relic_id).all()
         }
     forks_counts = get_fork_counts(db, relic_ids)
+    access_counts = get_access_counts(relics)
 
     result = []
     for relic in relics:
@@ -395,7 +397,7 @@ async def get_space_relics(
             "access_level": relic.access_level,
             "created_at": relic.created_at,
             "expires_at": relic.expires_at,
-            "access_count": relic.access_count,
+            "access_count": access_counts[relic.id],
             "bookmark_count": relic.bookmark_count,
             "comments_count": comments_counts.get(relic.id, 0),
             "forks_count": forks_counts.get(relic.id, 0),
@@ -5,6 +5,7 @@ Coordinates all periodic maintenance tasks including:
 - Database backups
 - Backup retention cleanup
 - Expired relic cleanup
+- Buffered access count flushing
 """
 import logging
 from typing import Optional
@@ -14,6 +15,7 @@ from apscheduler.triggers.cron import CronTrigger
 from backend.config import settings
 from backend.backup import perform_backup, cleanup_old_backups
 from backend.tasks import cleanup_expired_relics
+from backend.access_counts import flush_access_counts
 
 logger = logging.getLogger('relic.scheduler')
 
@@ -72,6 +74,17 @@ async def start_scheduler() -> None:
     )
     logger.info(f"Scheduled relic cleanup every {settings.RELIC_CLEANUP_INTERVAL} minutes")
 
+    # 3. Schedule Access Count Flush
+    scheduler.add_job(
+        func=flush_access_counts,
+        trigger='interval',
+        seconds=settings.ACCESS_COUNT_FLUSH_INTERVAL,
+        id='access_count_flush',
+        name='Access Count Flush',
+        replace_existing=True
+    )
+    logger.info(f"Scheduled access count flush every {settings.ACCESS_COUNT_FLUSH_INTERVAL} seconds")
+
     scheduler.start()
     logger.info("Background task scheduler started successfully")
 
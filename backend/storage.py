@@ -1,12 +1,44 @@
 """Storage service for S3/MinIO integration."""
+import asyncio
+import gzip
 import io
+from typing import Iterator, Optional, Tuple
 from minio import Minio
+from minio.commonconfig import ComposeSource, CopySource
 from minio.error import S3Error
+from minio.helpers import MAX_PART_SIZE
 from backend.config import settings
 
 
+# Non-text content types that are worth gzip-compressing at rest
+COMPRESSIBLE_TYPES = frozenset({
+    "application/json",
+    "application/xml",
+    "application/javascript",
+    "application/x-yaml",
+    "application/yaml",
+    "application/x-sh",
+    "application/sql",
+    "image/svg+xml",
+})
+
+# Below this size the gzip framing overhead outweighs any savings
+COMPRESSION_MIN_SIZE = 1024
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    """Check whether content of this MIME type should be stored gzip-compressed."""
+    base_type = (content_type or "").split(";", 1)[0].strip().lower()
+    return base_type.startswith("text/") or base_type in COMPRESSIBLE_TYPES
+
+
 class StorageService:
-    """Service for storing and retrieving relic content."""
+    """
+    Service for storing and retrieving relic content.
+
+    The MinIO client is blocking, so every call is run in a worker thread
+    to keep the event loop free while S3 I/O is in flight.
+    """
 
     def __init__(self):
         """Initialize MinIO/S3 client."""
@@ -30,6 +62,9 @@ class StorageService:
         """
         Upload content to S3.
 
+        Text-like content is gzip-compressed (level 1, for speed) and stored
+        with Content-Encoding: gzip when that makes it smaller.
+
         Args:
             key: S3 object key
             data: Content as bytes
@@ -38,22 +73,35 @@ class StorageService:
         Returns:
             S3 key
         """
-        try:
-            data_stream = io.BytesIO(data)
+        def _put() -> None:
+            payload, metadata = data, None
+            if (
+                settings.STORAGE_COMPRESSION_ENABLED
+                and len(data) >= COMPRESSION_MIN_SIZE
+                and is_compressible(content_type)
+            ):
+                compressed = gzip.compress(data, compresslevel=1)
+                if len(compressed) < len(data):
+                    payload, metadata = compressed, {"Content-Encoding": "gzip"}
+
             self.client.put_object(
                 bucket_name=self.bucket_name,
                 object_name=key,
-                data=data_stream,
-                length=len(data),
-                content_type=content_type
+                data=io.BytesIO(payload),
+                length=len(payload),
+                content_type=content_type,
+                metadata=metadata
             )
+
+        try:
+            await asyncio.to_thread(_put)
             return key
         except S3Error as e:
             raise Exception(f"Failed to upload to S3: {e}")
 
     async def download(self, key: str) -> bytes:
         """
-        Download content from S3.
+        Download content from S3, decompressing it if stored gzip-encoded.
 
         Args:
             key: S3 object key
@@ -61,19 +109,111 @@ class StorageService:
         Returns:
             Content as bytes
         """
-        try:
+        def _read() -> bytes:
             response = self.client.get_object(
                 bucket_name=self.bucket_name,
                 object_name=key
             )
-            return response.read()
+            try:
+                return response.read(decode_content=True)
+            finally:
+                response.close()
+                response.release_conn()
+
+        try:
+            return await asyncio.to_thread(_read)
+        except S3Error as e:
+            raise Exception(f"Failed to download from S3: {e}")
+
+    async def stream(
+        self,
+        key: str,
+        chunk_size: int = 64 * 1024,
+        decode: bool = True
+    ) -> Tuple[Iterator[bytes], Optional[str]]:
+        """
+        Open an S3 object for chunked reading.
+
+        The object is opened eagerly so missing keys fail here rather than
+        mid-response. The returned iterator is blocking; StreamingResponse
+        drains it in a threadpool.
+
+        Args:
+            key: S3 object key
+            chunk_size: Bytes per chunk
+            decode: If False, gzip-encoded objects are passed through compressed
+
+        Returns:
+            Tuple of (iterator over content chunks, content encoding of the
+            stored object or None if it is stored plain). The chunks are still
+            encoded only when decode is False.
+        """
+        try:
+            response = await asyncio.to_thread(
+                self.client.get_object,
+                bucket_name=self.bucket_name,
+                object_name=key
+            )
         except S3Error as e:
             raise Exception(f"Failed to download from S3: {e}")
 
+        stored_encoding = "gzip" if response.headers.get("Content-Encoding") == "gzip" else None
+        passthrough = not decode and stored_encoding is not None
+
+        def _iter_chunks() -> Iterator[bytes]:
+            try:
+                yield from response.stream(chunk_size, decode_content=not passthrough)
+            finally:
+                response.close()
+                response.release_conn()
+
+        return _iter_chunks(), stored_encoding
+
+    async def copy(self, source_key: str, dest_key: str) -> str:
+        """
+        Copy an object server-side without transferring its content.
+
+        Objects above the 5 GiB single-copy limit are copied as a multipart
+        compose, which does not carry metadata over, so their Content-Type and
+        Content-Encoding are passed along explicitly.
+
+        Args:
+            source_key: Existing S3 object key
+            dest_key: New S3 object key
+
+        Returns:
+            Destination S3 key
+        """
+        try:
+            await asyncio.to_thread(self._copy, source_key, dest_key)
+            return dest_key
+        except S3Error as e:
+            raise Exception(f"Failed to copy in S3: {e}")
+
+    def _copy(self, source_key: str, dest_key: str) -> None:
+        source = CopySource(bucket_name=self.bucket_name, object_name=source_key)
+        stat = self.client.stat_object(bucket_name=self.bucket_name, object_name=source_key)
+
+        if stat.size <= MAX_PART_SIZE:
+            self.client.copy_object(bucket_name=self.bucket_name, object_name=dest_key, source=source)
+            return
+
+        metadata = {"Content-Type": stat.content_type or "application/octet-stream"}
+        content_encoding = stat.metadata.get("Content-Encoding")
+        if content_encoding:
+            metadata["Content-Encoding"] = content_encoding
+        self.client.compose_object(
+            bucket_name=self.bucket_name,
+            object_name=dest_key,
+            sources=[ComposeSource.of(source)],
+            metadata=metadata
+        )
+
     async def delete(self, key: str) -> None:
         """Delete object from S3."""
         try:
-            self.client.remove_object(
+            await asyncio.to_thread(
+                self.client.remove_object,
                 bucket_name=self.bucket_name,
                 object_name=key
             )
@@ -83,7 +223,8 @@ class StorageService:
     async def exists(self, key: str) -> bool:
         """Check if object exists in S3."""
         try:
-            self.client.stat_object(
+            await asyncio.to_thread(
+                self.client.stat_object,
                 bucket_name=self.bucket_name,
                 object_name=key
             )
@@ -1,37 +1,95 @@
 """Background tasks for relic expiration and cleanup."""
+import asyncio
+import logging
 from datetime import datetime
+from typing import Optional, Tuple
+from sqlalchemy import select, delete
+from backend.config import settings
 from backend.database import SessionLocal
 from backend.models import Relic
 from backend.storage import storage_service
 
+logger = logging.getLogger('relic.tasks')
+
+# Maximum number of storage deletes in flight during cleanup
+STORAGE_DELETE_CONCURRENCY = 32
+
+
+async def _cleanup_expired_batch(db, now: datetime, after_id: str) -> Tuple[Optional[str], int]:
+    """
+    Delete one batch of expired relics with ids greater than after_id.
+
+    Returns:
+        Tuple of (last id examined or None when nothing is left, relics deleted)
+    """
+    expired = db.execute(
+        select(Relic.id, Relic.s3_key)
+        .where(Relic.expires_at <= now, Relic.id > after_id)
+        .order_by(Relic.id)
+        .limit(settings.RELIC_CLEANUP_BATCH_SIZE)
+    ).all()
+    if not expired:
+        return None, 0
+
+    # Delete from storage; relics whose object could not be removed are retried next run.
+    # S3 DELETE is idempotent, so there is no need for an exists() round-trip first.
+    semaphore = asyncio.Semaphore(STORAGE_DELETE_CONCURRENCY)
+
+    async def _purge(s3_key: str) -> None:
+        async with semaphore:
+            await storage_service.delete(s3_key)
+
+    results = await asyncio.gather(
+        *(_purge(s3_key) for _, s3_key in expired),
+        return_exceptions=True
+    )
+    deleted_ids = []
+    for (relic_id, _), result in zip(expired, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error cleaning up relic {relic_id}: {result}")
+        else:
+            deleted_ids.append(relic_id)
+
+    last_id = expired[-1][0]
+    if not deleted_ids:
+        return last_id, 0
+
+    # Hard delete from database
+    try:
+        db.execute(delete(Relic).where(Relic.id.in_(deleted_ids)))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error deleting expired relics: {e}")
+        return last_id, 0
+
+    return last_id, len(deleted_ids)
+
 
 async def cleanup_expired_relics():
     """
     Background task to delete expired relics.
 
-    Runs periodically to hard-delete relics that have expired.
-    Soft-deleted relics are hard-deleted after 30 days.
+    Runs periodically to hard-delete relics that have expired. Work is done
+    in batches of RELIC_CLEANUP_BATCH_SIZE (walking ids in order), so a large
+    backlog never loads every expired row at once: storage objects are
+    deleted concurrently, then every relic whose object was removed is
+    deleted from the database in a single statement.
     """
     db = SessionLocal()
     try:
         now = datetime.utcnow()
+        after_id = ""
+        total = 0
+
+        while True:
+            after_id, deleted = await _cleanup_expired_batch(db, now, after_id)
+            if after_id is None:
+                break
+            total += deleted
 
-        # Find expired relics
-        expired_relics = db.query(Relic).filter(
-            Relic.expires_at <= now
-        ).all()
-
-        for relic in expired_relics:
-            try:
-                # Delete from storage
-                await storage_service.delete(relic.s3_key)
-                # Hard delete from database
-                db.delete(relic)
-                db.commit()
-                print(f"Expired relic {relic.id} permanently deleted")
-            except Exception as e:
-                print(f"Error cleaning up relic {relic.id}: {e}")
-                db.rollback()
+        if total:
+            logger.info(f"{total} expired relics permanently deleted")
 
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
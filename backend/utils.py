@@ -1,4 +1,6 @@
 """Utility functions."""
+import hmac
+import os
 import secrets
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
@@ -30,9 +32,53 @@ def generate_relic_id() -> str:
     return secrets.token_hex(16)  # 16 bytes = 32 hex characters
 
 
+# scrypt cost parameters (~16 MiB memory per hash)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+
+def _scrypt(password: str, salt: bytes) -> bytes:
+    return hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+
+
 def hash_password(password: str) -> str:
-    """Hash a password using SHA256."""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """
+    Hash a password with a random salt using scrypt.
+
+    Returns:
+        "salt$hash", both hex-encoded
+    """
+    salt = os.urandom(16)
+    return f"{salt.hex()}${_scrypt(password, salt).hex()}"
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """
+    Check a password against a stored hash in constant time.
+
+    Also accepts legacy unsalted SHA256 hex digests.
+    """
+    if "$" not in password_hash:
+        candidate = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(candidate, password_hash)
+
+    salt_hex, _, hash_hex = password_hash.partition("$")
+    try:
+        salt = bytes.fromhex(salt_hex)
+    except ValueError:
+        return False
+    return hmac.compare_digest(_scrypt(password, salt).hex(), hash_hex)
+
+
+_EXPIRY_UNITS = {
+    "m": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+    "M": timedelta(days=30),
+    "y": timedelta(days=365),
+}
 
 
 def parse_expiry_string(expires_in: Optional[str]) -> Optional[datetime]:
@@ -48,26 +94,13 @@ def parse_expiry_string(expires_in: Optional[str]) -> Optional[datetime]:
     if not expires_in or expires_in == "never":
         return None
 
-    now = datetime.utcnow()
-    multipliers = {
-        "m": 60,
-        "h": 3600,
-        "d": 86400,
-        "w": 604800,
-        "M": 2592000,  # 30 days
-        "y": 31536000  # 365 days
-    }
+    unit = _EXPIRY_UNITS.get(expires_in[-1])
+    if unit is None:
+        return None
 
     try:
-        value = int(expires_in[:-1])
-        unit = expires_in[-1]
-
-        if unit not in multipliers:
-            return None
-
-        seconds = value * multipliers[unit]
-        return now + timedelta(seconds=seconds)
-    except (ValueError, KeyError):
+        return datetime.utcnow() + int(expires_in[:-1]) * unit
+    except (ValueError, OverflowError):
         return None
 
 
@@ -78,6 +111,27 @@ def is_expired(expires_at: Optional[datetime]) -> bool:
     return datetime.utcnow() > expires_at
 
 
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Check whether an Accept-Encoding header allows gzip, honouring q-values."""
+    wildcard = None
+    for entry in (accept_encoding or "").split(","):
+        coding, *params = [part.strip() for part in entry.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        coding = coding.lower()
+        if coding in ("gzip", "x-gzip"):
+            return quality > 0
+        if coding == "*":
+            wildcard = quality > 0
+    return bool(wildcard)
+
+
 MAX_PAGE_LIMIT = 1000
 
 
@@ -3,6 +3,10 @@ import { detectLanguageHint } from '../typeUtils.js'
 import { decodeContent, getTextMetadata } from './utils/contentUtils'
 import { parseAnsiCodes, containsAnsiCodes } from './utils/ansiUtils'
 
+// LRU cache of auto-detected languages, keyed on the sampled content prefix
+const DETECTED_LANGUAGES_MAX = 256
+const detectedLanguages = new Map()
+
 /**
  * Detect programming language from content
  */
@@ -18,20 +22,47 @@ export function detectLanguage(content, contentType, languageHint) {
     }
 
     // Try to auto-detect based on content
-    try {
-        const result = hljs.highlightAuto(content.slice(0, 1000))
-        return result.language || 'plaintext'
-    } catch (e) {
-        return 'plaintext'
+    const sample = content.slice(0, 1000)
+    let language = detectedLanguages.get(sample)
+    if (language === undefined) {
+        try {
+            language = hljs.highlightAuto(sample).language || 'plaintext'
+        } catch (e) {
+            language = 'plaintext'
+        }
+        if (detectedLanguages.size >= DETECTED_LANGUAGES_MAX) {
+            // Evict the least recently used entry (Map keeps insertion order)
+            detectedLanguages.delete(detectedLanguages.keys().next().value)
+        }
+    } else {
+        detectedLanguages.delete(sample)
+    }
+    detectedLanguages.set(sample, language)
+    return language
+}
+
+// Cache of language hint -> registered highlight.js language name
+const resolvedLanguages = new Map()
+
+/**
+ * Resolve a language hint to a registered highlight.js language, once per hint
+ */
+function resolveLanguage(language) {
+    let resolved = resolvedLanguages.get(language)
+    if (resolved === undefined) {
+        resolved = language && hljs.getLanguage(language) ? language : 'plaintext'
+        resolvedLanguages.set(language, resolved)
     }
+    return resolved
 }
 
 /**
  * Highlight code with syntax highlighting
  */
 export function highlightCode(content, language) {
+    const resolved = resolveLanguage(language)
     try {
-        const highlighted = hljs.highlight(content, { language, ignoreIllegals: true })
+        const highlighted = hljs.highlight(content, { language: resolved, ignoreIllegals: true })
         return highlighted.value
     } catch (e) {
         // Fallback to plain text if highlighting fails
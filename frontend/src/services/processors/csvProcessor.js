@@ -1,29 +1,47 @@
-import { decodeContent } from './utils/contentUtils'
+/**
+ * Iterate over lines without materializing the full line array
+ */
+function* iterLines(text) {
+    let start = 0
+    while (start <= text.length) {
+        let end = text.indexOf('\n', start)
+        if (end === -1) end = text.length
+        const line = text.charCodeAt(end - 1) === 13 ? text.slice(start, end - 1) : text.slice(start, end)
+        // Skip the empty line produced by a trailing newline
+        if (end < text.length || line) yield line
+        start = end + 1
+    }
+}
 
 /**
  * Process CSV content
+ * @param {string} text - Decoded CSV text
+ * @param {number} [byteLength] - Size of the raw content in bytes
  */
-export function processCSV(content) {
-    const text = decodeContent(content)
-    const lines = text.split(/\r?\n/)
-    const headers = lines[0]?.split(',').map(h => h.trim()) || []
-    const rows = lines.slice(1).map(line => {
+export function processCSV(text, byteLength) {
+    const lines = iterLines(text)
+    const headers = lines.next().value?.split(',').map(h => h.trim()) || []
+    // Rows are arrays of cells aligned with headers (cheaper than one object per row,
+    // and duplicate column names don't collapse)
+    const columnCount = headers.length
+    const rows = []
+    for (const line of lines) {
         const cells = line.split(',')
-        const row = {}
-        headers.forEach((header, idx) => {
-            row[header] = cells[idx]?.trim() || ''
-        })
-        return row
-    })
+        const row = new Array(columnCount)
+        for (let idx = 0; idx < columnCount; idx++) {
+            row[idx] = cells[idx]?.trim() || ''
+        }
+        rows.push(row)
+    }
 
     return {
         type: 'csv',
         rows,
         metadata: {
-            columnCount: headers.length,
-            rowCount: lines.length - 1,
+            columnCount,
+            rowCount: rows.length,
             columns: headers,
-            fileSize: content.byteLength || text.length
+            fileSize: byteLength ?? text.length
         }
     }
 }
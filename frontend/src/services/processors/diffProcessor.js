@@ -4,7 +4,7 @@ import { highlightCode } from './codeProcessor.js';
 /**
  * Process unified diff content
  */
-export async function processDiff(content) {
+export function processDiff(content) {
   const text = decodeContent(content);
   const metadata = getTextMetadata(text);
   
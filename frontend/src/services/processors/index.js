@@ -4,6 +4,7 @@
  */
 
 import { getFileTypeDefinition, isCodeType } from '../typeUtils.js'
+import { decodeContent } from './utils/contentUtils'
 
 // Import processors from their specific files
 import { processText, shouldEnableAnsiByDefault } from './textProcessor.js'
@@ -37,6 +38,9 @@ export {
   processDiff
 }
 
+// Categories whose content is binary and must reach the processor as raw bytes
+const BINARY_CATEGORIES = new Set(['archive', 'pdf', 'image'])
+
 /**
  * Main processor function that delegates to type-specific processors
  */
@@ -46,39 +50,43 @@ export async function processContent(content, contentType, languageHint) {
     return processMarkdown(content)
   }
 
+  const typeDef = getFileTypeDefinition(contentType)
+
+  // Decode text content once and share it between relic index detection
+  // and the processor, instead of each running its own TextDecoder pass
+  const text = BINARY_CATEGORIES.has(typeDef.category) ? content : decodeContent(content)
+
   // Check for relicindex
-  if (isRelicIndex(content, contentType)) {
-    return processRelicIndex(content)
+  if (isRelicIndex(text, contentType)) {
+    return processRelicIndex(text)
   }
 
-  const typeDef = getFileTypeDefinition(contentType)
-
   switch (typeDef.category) {
     case 'html':
-      return processHTML(content)
+      return processHTML(text)
     case 'markdown':
-      return processMarkdown(content)
+      return processMarkdown(text)
     case 'pdf':
       return processPDF(content)
     case 'csv':
-      return processCSV(content)
+      return processCSV(text, content.byteLength)
     case 'image':
       return processImage(content, contentType)
     case 'archive':
       return processArchive(content, contentType)
     case 'excalidraw':
-      return processExcalidraw(content, contentType)
+      return processExcalidraw(text, contentType)
     case 'diff':
-      return processDiff(content)
+      return processDiff(text)
     case 'code':
-      return processCode(content, contentType, languageHint)
+      return processCode(text, contentType, languageHint)
     case 'text':
-      return processText(content)
+      return processText(text)
     default:
       // Fallback for unknown types that might still be code
       if (isCodeType(contentType)) {
-        return processCode(content, contentType, languageHint)
+        return processCode(text, contentType, languageHint)
       }
-      return processText(content)
+      return processText(text)
   }
 }
@@ -12,7 +12,7 @@ import rehypeHighlight from 'rehype-highlight'
 import rehypeSanitize from 'rehype-sanitize'
 import rehypeStringify from 'rehype-stringify'
 import hljs from 'highlight.js'
-import { decodeContent } from './utils/contentUtils'
+import { decodeContent, countLines, countWords } from './utils/contentUtils'
 
 // Import a light theme CSS for highlight.js
 import 'highlight.js/styles/github.css'
@@ -115,9 +115,9 @@ export async function processMarkdown(content) {
       html,
       preview: text,
       metadata: {
-        lineCount: text.split('\n').length,
+        lineCount: countLines(text),
         charCount: text.length,
-        wordCount: text.split(/\s+/).filter(word => word.length > 0).length,
+        wordCount: countWords(text),
         hasCodeBlocks: (html.match(/<code/g) || []).length,
         hasTables: html.includes('<table'),
         hasLinks: html.includes('<a'),
@@ -141,9 +141,9 @@ export async function processMarkdown(content) {
       html: `<div class="markdown-error">${escapedHtml}</div>`,
       preview: text,
       metadata: {
-        lineCount: text.split('\n').length,
+        lineCount: countLines(text),
         charCount: text.length,
-        wordCount: text.split(/\s+/).filter(word => word.length > 0).length,
+        wordCount: countWords(text),
         hasCodeBlocks: 0,
         hasTables: false,
         hasLinks: false,
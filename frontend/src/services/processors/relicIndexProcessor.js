@@ -5,7 +5,7 @@ import { getFileTypeDefinition } from '../typeUtils'
  * Process a relic index file (list of relic IDs)
  * Supports both simple list of IDs and structured YAML with metadata
  */
-async function processRelicIndexInternal(content) {
+function processRelicIndexInternal(content) {
     const text = decodeContent(content)
     const lines = text.split('\n')
     const relicIds = []
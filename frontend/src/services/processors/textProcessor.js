@@ -1,6 +1,14 @@
-import { decodeContent, getTextMetadata } from './utils/contentUtils'
+import { decodeContent, getTextMetadata, countWords } from './utils/contentUtils'
 import { parseAnsiCodes, containsAnsiCodes } from './utils/ansiUtils'
 
+// Languages for which ANSI processing stays off by default
+const CODE_LANGUAGES = new Set([
+    'javascript', 'typescript', 'python', 'java', 'go', 'rust', 'c', 'cpp',
+    'csharp', 'ruby', 'php', 'swift', 'kotlin', 'scala', 'groovy', 'gradle',
+    'html', 'xml', 'json', 'yaml', 'css', 'scss', 'less', 'sql', 'dockerfile',
+    'makefile', 'bash', 'sh', 'zsh', 'ps1', 'ps2'
+])
+
 /**
  * Determine if ANSI processing should be enabled by default for this file
  */
@@ -16,14 +24,7 @@ export function shouldEnableAnsiByDefault(metadata, contentType, language) {
     }
 
     // Disable for code files and structured data
-    const codeExtensions = [
-        'javascript', 'typescript', 'python', 'java', 'go', 'rust', 'c', 'cpp',
-        'csharp', 'ruby', 'php', 'swift', 'kotlin', 'scala', 'groovy', 'gradle',
-        'html', 'xml', 'json', 'yaml', 'css', 'scss', 'less', 'sql', 'dockerfile',
-        'makefile', 'bash', 'sh', 'zsh', 'ps1', 'ps2'
-    ]
-
-    if (codeExtensions.includes(lang)) return false
+    if (CODE_LANGUAGES.has(lang)) return false
 
     // Default to OFF unless explicitly detected as log
     return false
@@ -52,7 +53,7 @@ export function processText(content, contentType = null, languageHint = null) {
             metadata: {
                 ...metadata,
                 hasAnsiCodes: true,
-                wordCount: cleanText.split(/\s+/).length
+                wordCount: countWords(cleanText)
             }
         }
     }
@@ -64,7 +65,7 @@ export function processText(content, contentType = null, languageHint = null) {
         hasAnsiCodes: false,
         metadata: {
             ...metadata,
-            wordCount: text.split(/\s+/).length
+            wordCount: countWords(text)
         }
     }
 }
@@ -10,7 +10,32 @@ export function decodeContent(content) {
  */
 export function getTextMetadata(text) {
     return {
-        lineCount: text.split(/\r?\n/).length,
+        lineCount: countLines(text),
         charCount: text.length
     }
 }
+
+/**
+ * Count lines without materializing them (\r\n and \n both end a line)
+ */
+export function countLines(text) {
+    let count = 1
+    let idx = text.indexOf('\n')
+    while (idx !== -1) {
+        count++
+        idx = text.indexOf('\n', idx + 1)
+    }
+    return count
+}
+
+const WORD_RE = /\S+/g
+
+/**
+ * Count whitespace-separated words without materializing them
+ */
+export function countWords(text) {
+    let count = 0
+    WORD_RE.lastIndex = 0
+    while (WORD_RE.exec(text) !== null) count++
+    return count
+}
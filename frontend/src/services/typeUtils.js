@@ -14,13 +14,36 @@ const UNKNOWN_TYPE = {
   category: 'unknown'
 }
 
+// Precomputed lookup tables (first definition wins, matching FILE_TYPES.find order)
+const TYPES_BY_MIME = new Map()
+const TYPES_BY_SYNTAX = new Map()
+for (const t of FILE_TYPES) {
+  const mime = t.mime.toLowerCase()
+  if (!TYPES_BY_MIME.has(mime)) TYPES_BY_MIME.set(mime, t)
+  if (!TYPES_BY_SYNTAX.has(t.syntax)) TYPES_BY_SYNTAX.set(t.syntax, t)
+}
+
+// Resolved definitions per content type; the set of distinct content types is small
+const RESOLVED_TYPES_MAX = 500
+const resolvedTypes = new Map()
+
 export function getFileTypeDefinition(contentType) {
-  if (!contentType) return FILE_TYPES.find(t => t.syntax === 'text')
+  if (!contentType) return TYPES_BY_SYNTAX.get('text')
+
+  let type = resolvedTypes.get(contentType)
+  if (type === undefined) {
+    type = resolveFileTypeDefinition(contentType)
+    if (resolvedTypes.size >= RESOLVED_TYPES_MAX) resolvedTypes.clear()
+    resolvedTypes.set(contentType, type)
+  }
+  return type
+}
 
+function resolveFileTypeDefinition(contentType) {
   const lowerType = contentType.toLowerCase()
 
   // First, try exact MIME type match
-  const exactMatch = FILE_TYPES.find(t => lowerType === t.mime.toLowerCase())
+  const exactMatch = TYPES_BY_MIME.get(lowerType)
   if (exactMatch) return exactMatch
 
   // Then try partial MIME type match (for variations like text/html; charset=utf-8)
@@ -28,10 +51,10 @@ export function getFileTypeDefinition(contentType) {
   if (mimeMatch) return mimeMatch
 
   // Special cases for generic matches
-  if (lowerType.includes('pdf')) return FILE_TYPES.find(t => t.syntax === 'pdf')
-  if (lowerType.includes('image')) return FILE_TYPES.find(t => t.syntax === 'image')
-  if (lowerType.includes('csv')) return FILE_TYPES.find(t => t.syntax === 'csv')
-  if (lowerType.includes('zip') || lowerType.includes('archive') || lowerType.includes('tar') || lowerType.includes('gzip')) return FILE_TYPES.find(t => t.syntax === 'archive')
+  if (lowerType.includes('pdf')) return TYPES_BY_SYNTAX.get('pdf')
+  if (lowerType.includes('image')) return TYPES_BY_SYNTAX.get('image')
+  if (lowerType.includes('csv')) return TYPES_BY_SYNTAX.get('csv')
+  if (lowerType.includes('zip') || lowerType.includes('archive') || lowerType.includes('tar') || lowerType.includes('gzip')) return TYPES_BY_SYNTAX.get('archive')
 
   // Extension-based detection for files with custom formats (e.g., .excalidraw, .excalidraw.json)
   const extensionMatch = FILE_TYPES.find(t => {
@@ -48,7 +71,7 @@ export function getFileTypeDefinition(contentType) {
   if (syntaxMatch) return syntaxMatch
 
   // Fallback to text if it includes text
-  if (lowerType.includes('text')) return FILE_TYPES.find(t => t.syntax === 'text')
+  if (lowerType.includes('text')) return TYPES_BY_SYNTAX.get('text')
 
   return UNKNOWN_TYPE
 }
@@ -68,13 +91,13 @@ export function getTypeIconColor(contentType) {
 
 // Map type selections to MIME types
 export function getContentType(syntax) {
-  const type = FILE_TYPES.find(t => t.syntax === syntax)
+  const type = TYPES_BY_SYNTAX.get(syntax)
   return type ? type.mime : 'text/plain'
 }
 
 // Map language selection to file extensions
 export function getFileExtension(syntax) {
-  const type = FILE_TYPES.find(t => t.syntax === syntax)
+  const type = TYPES_BY_SYNTAX.get(syntax)
   return type ? type.extensions[0] : 'txt'
 }
 
@@ -93,6 +116,9 @@ export function getSyntaxFromExtension(extension) {
   return type ? type.syntax : null
 }
 
+// Other common code indicators in MIME types, matched in a single pass
+const CODE_INDICATOR_RE = /script|source/i
+
 // Check if content type is a code type
 export function isCodeType(contentType) {
   if (!contentType) return false
@@ -101,12 +127,7 @@ export function isCodeType(contentType) {
   if (type.category === 'code') return true
 
   // Fallback checks for other common code indicators
-  const lowerType = contentType.toLowerCase()
-  if (lowerType.includes('script') || lowerType.includes('source')) {
-    return true
-  }
-
-  return false
+  return CODE_INDICATOR_RE.test(contentType)
 }
 
 // Get all available syntax options for forms (flat list, searchable by language name)
@@ -1,54 +1,93 @@
 """Pytest configuration and fixtures."""
+from datetime import datetime
+import httpx
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from backend.main import app
 from backend.database import Base, get_db
+from backend.models import Relic
+from backend.utils import generate_relic_id
+from backend import access_counts
 
 
-# Use in-memory SQLite for tests
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test.db"
+# Use in-memory SQLite for tests. StaticPool keeps the single connection (and so
+# the database) alive for the whole session; each xdist worker process gets its own.
+SQLALCHEMY_TEST_DATABASE_URL = "sqlite://"
 
 engine = create_engine(
     SQLALCHEMY_TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
 )
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN itself
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
 
-@pytest.fixture(scope="function")
-def db():
-    """Create a test database session."""
+
+@event.listens_for(engine, "begin")
+def _begin_sqlite_transaction(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    """Create the schema once per test session."""
     Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db(db_schema):
+    """
+    Create a test database session inside a transaction that is rolled back.
+
+    Commits made by tests and routes only release a SAVEPOINT, so every test
+    starts from an empty schema without recreating it.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint"
+    )
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
-@pytest.fixture(scope="function")
-def client(db):
-    """Create a test client with test database."""
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            db.close()
+@pytest.fixture(scope="session")
+def storage_data():
+    """Simple in-memory storage backing the mocked storage service."""
+    return {}
 
-    app.dependency_overrides[get_db] = override_get_db
 
+@pytest.fixture(scope="session")
+def app_client(storage_data):
+    """
+    Start the app once per session with storage mocked.
+
+    The background scheduler is not started: its interval jobs would fire
+    against the test database while tests are running.
+    """
     # Mock storage service to avoid MinIO connection
     with patch("backend.main.storage_service") as mock_main_storage, \
          patch("backend.routes.relics.storage_service") as mock_storage, \
-         patch("backend.routes.admin.storage_service") as mock_admin_storage:
-        # Simple in-memory storage for tests
-        storage_data = {}
+         patch("backend.routes.admin.storage_service") as mock_admin_storage, \
+         patch("backend.main.start_scheduler", AsyncMock()):
 
         async def mock_upload(key, data, content_type="application/octet-stream"):
             storage_data[key] = data
@@ -57,6 +96,13 @@ def client(db):
         async def mock_download(key):
             return storage_data.get(key, b"")
 
+        async def mock_stream(key, chunk_size=64 * 1024, decode=True):
+            return iter([storage_data.get(key, b"")]), None
+
+        async def mock_copy(source_key, dest_key):
+            storage_data[dest_key] = storage_data.get(source_key, b"")
+            return dest_key
+
         async def mock_delete(key):
             storage_data.pop(key, None)
 
@@ -67,16 +113,54 @@ def client(db):
             mock.ensure_bucket = MagicMock()
             mock.upload = AsyncMock(side_effect=mock_upload)
             mock.download = AsyncMock(side_effect=mock_download)
+            mock.stream = AsyncMock(side_effect=mock_stream)
+            mock.copy = AsyncMock(side_effect=mock_copy)
             mock.delete = AsyncMock(side_effect=mock_delete)
             mock.exists = AsyncMock(side_effect=mock_exists)
 
         with TestClient(app) as test_client:
             yield test_client
 
+
+@pytest.fixture(scope="function")
+def client(db, app_client, storage_data):
+    """Return the shared test client, wired to this test's database session."""
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    storage_data.clear()
+    access_counts._pending_access_counts.clear()
+    app_client.cookies.clear()
+
+    yield app_client
+
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
+def make_relic():
+    """Factory for unsaved Relic rows with test defaults; keyword arguments override them."""
+    def _make_relic(client_id=None, **overrides):
+        fields = {
+            "id": generate_relic_id(),
+            "client_id": client_id,
+            "name": "Test Relic",
+            "content_type": "text/plain",
+            "access_level": "public",
+            "created_at": datetime.utcnow(),
+            "size_bytes": 100,
+        }
+        fields.update(overrides)
+        return Relic(**fields)
+
+    return _make_relic
+
+
+@pytest.fixture(scope="session")
 def test_file_content():
     """Sample file content for testing."""
     return b"Hello, World! This is a test relic."
@@ -91,16 +175,28 @@ def test_file_dict(test_file_content):
         "content": test_file_content
     }
 
+@pytest.fixture(scope="session")
+def created_relic_upload(test_file_content):
+    """Multipart body and content type for created_relic, encoded once per session."""
+    request = httpx.Request(
+        "POST",
+        "http://testserver/api/v1/relics",
+        data={"name": "Test Relic", "access_level": "public"},
+        files={"file": ("test.txt", test_file_content, "text/plain")}
+    )
+    return request.read(), request.headers["Content-Type"]
+
+
 @pytest.fixture
-def created_relic(client, test_file_content):
+def created_relic(client, created_relic_upload):
     """Create a relic and return its ID, data, and client key."""
+    body, content_type = created_relic_upload
     # Force client creation with a specific key
     client_key = "test_client_key_123"
     response = client.post(
         "/api/v1/relics",
-        headers={"x-client-key": client_key},
-        data={"name": "Test Relic", "access_level": "public"},
-        files={"file": ("test.txt", test_file_content, "text/plain")}
+        headers={"x-client-key": client_key, "Content-Type": content_type},
+        content=body
     )
     assert response.status_code == 200
     return {
@@ -0,0 +1,41 @@
+"""Tests for buffered access counting."""
+import pytest
+from collections import Counter
+from unittest.mock import MagicMock
+
+from backend import access_counts
+from backend.access_counts import flush_access_counts, get_access_counts, record_relic_access
+from backend.models import Relic
+
+
+@pytest.mark.unit
+def test_get_access_counts_adds_buffered_accesses(monkeypatch):
+    """Buffered accesses are added to each relic's stored count."""
+    monkeypatch.setattr(access_counts, "_pending_access_counts", Counter())
+    record_relic_access("a" * 32)
+
+    relics = [Relic(id="a" * 32, access_count=5), Relic(id="b" * 32, access_count=None)]
+    assert get_access_counts(relics) == {"a" * 32: 6, "b" * 32: 0}
+
+
+@pytest.mark.unit
+def test_flush_access_counts_keeps_deltas_on_failure(monkeypatch):
+    """A failed flush merges its deltas back with accesses recorded meanwhile."""
+    monkeypatch.setattr(access_counts, "_pending_access_counts", Counter())
+    record_relic_access("a" * 32)
+    record_relic_access("a" * 32)
+    record_relic_access("b" * 32)
+
+    session = MagicMock()
+
+    def failing_execute(*args, **kwargs):
+        record_relic_access("a" * 32)  # an access arriving mid-flush
+        raise Exception("database unavailable")
+
+    session.execute.side_effect = failing_execute
+    monkeypatch.setattr("backend.access_counts.SessionLocal", lambda: session)
+
+    assert flush_access_counts() == 0
+    session.rollback.assert_called_once()
+    session.close.assert_called_once()
+    assert access_counts._pending_access_counts == {"a" * 32: 3, "b" * 32: 1}
@@ -34,6 +34,24 @@ def test_create_relic(client):
     assert data["size_bytes"] == len(content)
 
 
+@pytest.mark.unit
+def test_create_relic_failure_removes_stored_content(client, db, storage_data, monkeypatch):
+    """Test that content uploaded for a relic that fails to save is deleted again."""
+    def failing_commit():
+        raise Exception("database unavailable")
+
+    monkeypatch.setattr(db, "commit", failing_commit)
+
+    response = client.post(
+        "/api/v1/relics",
+        data={"name": "Doomed"},
+        files={"file": ("test.txt", BytesIO(b"orphan"), "text/plain")}
+    )
+
+    assert response.status_code == 500
+    assert storage_data == {}
+
+
 @pytest.mark.unit
 def test_get_relic(client, created_relic):
     """Test retrieving a relic."""
@@ -48,6 +66,28 @@ def test_get_relic(client, created_relic):
     assert relic["access_level"] == "public"
 
 
+@pytest.mark.unit
+def test_access_count_flush(client, db, created_relic, monkeypatch):
+    """Test that buffered access counts are reported and flushed to the database."""
+    from backend.models import Relic
+    from backend.access_counts import flush_access_counts
+
+    relic_id = created_relic["id"]
+    client.get(f"/api/v1/relics/{relic_id}")
+    response = client.get(f"/api/v1/relics/{relic_id}")
+    assert response.json()["access_count"] == 2
+
+    listed = {r["id"]: r for r in client.get("/api/v1/relics").json()["relics"]}
+    assert listed[relic_id]["access_count"] == 2
+
+    monkeypatch.setattr("backend.access_counts.SessionLocal", lambda: db)
+    assert flush_access_counts() == 1
+
+    relic = db.query(Relic).filter(Relic.id == relic_id).first()
+    db.refresh(relic)
+    assert relic.access_count == 2
+
+
 @pytest.mark.unit
 def test_get_nonexistent_relic(client):
     """Test getting a relic that doesn't exist."""
@@ -91,6 +131,36 @@ def test_fork_relic(client, created_relic):
     assert forked["fork_of"] == original_id
 
 
+@pytest.mark.unit
+def test_fork_relic_without_content(client, created_relic, test_file_content):
+    """Test forking a relic without new content copies the original content."""
+    original_id = created_relic["id"]
+
+    fork_response = client.post(f"/api/v1/relics/{original_id}/fork")
+    assert fork_response.status_code == 200
+    fork_id = fork_response.json()["id"]
+
+    raw_response = client.get(f"/{fork_id}/raw")
+    assert raw_response.content == test_file_content
+
+    fork = client.get(f"/api/v1/relics/{fork_id}").json()
+    assert fork["size_bytes"] == len(test_file_content)
+
+
+@pytest.mark.unit
+def test_fork_relic_failure_removes_copied_content(client, db, created_relic, storage_data, monkeypatch):
+    """Test that a server-side copy for a fork that fails to save is deleted again."""
+    def failing_commit():
+        raise Exception("database unavailable")
+
+    monkeypatch.setattr(db, "commit", failing_commit)
+
+    response = client.post(f"/api/v1/relics/{created_relic['id']}/fork")
+
+    assert response.status_code == 500
+    assert list(storage_data) == [f"relics/{created_relic['id']}"]
+
+
 @pytest.mark.unit
 def test_list_relics(client):
     """Test listing recent relics."""
@@ -136,6 +206,27 @@ def test_get_relic_lineage(client, created_relic):
     assert history["root"]["children"][0]["id"] == fork_id
 
 
+@pytest.mark.unit
+def test_get_relic_lineage_from_grandchild(client, created_relic):
+    """Test lineage resolves the root through several fork levels and deleted parents."""
+    original_id = created_relic["id"]
+    fork_id = client.post(f"/api/v1/relics/{original_id}/fork").json()["id"]
+    grandchild_id = client.post(f"/api/v1/relics/{fork_id}/fork").json()["id"]
+
+    history = client.get(f"/api/v1/relics/{grandchild_id}/lineage").json()
+    assert history["root"]["id"] == original_id
+    assert history["total_nodes"] == 3
+    assert history["root"]["children"][0]["children"][0]["id"] == grandchild_id
+
+    # Deleting the original makes the first fork the topmost surviving relic
+    client.delete(f"/api/v1/relics/{original_id}", headers={"x-client-key": created_relic["client_key"]})
+    history = client.get(f"/api/v1/relics/{grandchild_id}/lineage").json()
+    assert history["root"]["id"] == fork_id
+    assert history["total_nodes"] == 2
+
+    assert client.get("/api/v1/relics/nonexistent/lineage").status_code == 404
+
+
 @pytest.mark.unit
 def test_get_raw_content(client, created_relic):
     """Test getting raw relic content."""
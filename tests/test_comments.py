@@ -1,7 +1,19 @@
 import pytest
 
+from backend.models import Comment
+
+
+@pytest.fixture
+def relic_id(db, make_relic):
+    """Insert a relic directly, skipping the multipart upload round-trip."""
+    relic = make_relic(name="test.txt", s3_key="relics/test")
+    db.add(relic)
+    db.commit()
+    return relic.id
+
+
 @pytest.mark.unit
-def test_create_and_get_comment(client):
+def test_create_and_get_comment(client, db, relic_id):
     # Register client
     import uuid
     client_key = uuid.uuid4().hex
@@ -13,12 +25,6 @@ def test_create_and_get_comment(client):
     response = client.put("/api/v1/client/name", json={"name": "Test User"}, headers=headers)
     assert response.status_code == 200
 
-    # Create a relic
-    files = {"file": ("test.txt", b"test content")}
-    response = client.post("/api/v1/relics", files=files, headers=headers)
-    assert response.status_code == 200
-    relic_id = response.json()["id"]
-
     # Create a comment
     comment_data = {"line_number": 1, "content": "This is a comment"}
     response = client.post(f"/api/v1/relics/{relic_id}/comments", json=comment_data, headers=headers)
@@ -27,20 +33,20 @@ def test_create_and_get_comment(client):
     assert comment["content"] == "This is a comment"
     assert comment["line_number"] == 1
     assert comment["author_name"] == "Test User"
+    assert comment["relic_id"] == relic_id
     comment_id = comment["id"]
 
-    # Get comments
+    # List comments (the only coverage of the list endpoint's shape)
     response = client.get(f"/api/v1/relics/{relic_id}/comments")
     assert response.status_code == 200
-    comments = response.json()
-    assert len(comments) == 1
-    assert comments[0]["id"] == comment_id
+    data = response.json()
+    assert data["total"] == 1
+    assert [c["id"] for c in data["comments"]] == [comment_id]
 
     # Delete comment
     response = client.delete(f"/api/v1/relics/{relic_id}/comments/{comment_id}", headers=headers)
     assert response.status_code == 200
 
     # Verify deletion
-    response = client.get(f"/api/v1/relics/{relic_id}/comments")
-    assert response.status_code == 200
-    assert len(response.json()) == 0
+    db.expire_all()
+    assert db.query(Comment).filter_by(relic_id=relic_id).count() == 0
@@ -1,4 +1,5 @@
 import pytest
+from io import BytesIO
 
 @pytest.mark.unit
 def test_get_raw_root_route(client):
@@ -9,18 +10,97 @@ def test_get_raw_root_route(client):
     create_response = client.post(
         "/api/v1/relics",
         data={"name": "Raw Test"},
-        files={"file": ("test.txt", content, "text/plain")}
+        files={"file": ("test.txt", BytesIO(content), "text/plain")}
     )
     assert create_response.status_code == 200
     relic_id = create_response.json()["id"]
 
     # Test getting raw content via /{relic_id}/raw (existing)
-    response_raw = client.get(f"/{relic_id}/raw")
-    assert response_raw.status_code == 200
-    assert response_raw.content == content
+    with client.stream("GET", f"/{relic_id}/raw") as response_raw:
+        assert response_raw.status_code == 200
+        assert response_raw.read() == content
 
     # Test getting raw content via /{relic_id} (new requirement)
-    response_root = client.get(f"/{relic_id}")
+    with client.stream("GET", f"/{relic_id}") as response_root:
+        assert response_root.status_code == 200
+        assert response_root.read() == content
 
-    assert response_root.status_code == 200
-    assert response_root.content == content
+
+@pytest.mark.unit
+def test_raw_route_reflects_update(client):
+    """Test that raw content headers follow updates to the relic."""
+    client_key = "f" * 32
+    create_response = client.post(
+        "/api/v1/relics",
+        headers={"X-Client-Key": client_key},
+        data={"name": "before.txt"},
+        files={"file": ("before.txt", BytesIO(b"cached content"), "text/plain")}
+    )
+    relic_id = create_response.json()["id"]
+
+    response = client.get(f"/{relic_id}/raw")
+    assert "before.txt" in response.headers["content-disposition"]
+
+    update_response = client.put(
+        f"/api/v1/relics/{relic_id}",
+        json={"name": "after.txt"},
+        headers={"X-Client-Key": client_key}
+    )
+    assert update_response.status_code == 200
+
+    response = client.get(f"/{relic_id}/raw")
+    assert "after.txt" in response.headers["content-disposition"]
+
+
+@pytest.mark.unit
+def test_raw_route_checks_current_access(client, db):
+    """Test that access changes and deletion apply to the raw route immediately."""
+    from backend.models import Relic
+
+    create_response = client.post(
+        "/api/v1/relics",
+        headers={"X-Client-Key": "e" * 32},
+        data={"name": "shared.txt"},
+        files={"file": ("shared.txt", BytesIO(b"shared content"), "text/plain")}
+    )
+    relic_id = create_response.json()["id"]
+    assert client.get(f"/{relic_id}/raw").status_code == 200
+
+    db.query(Relic).filter(Relic.id == relic_id).update({"access_level": "restricted"})
+    db.commit()
+    assert client.get(f"/{relic_id}/raw").status_code == 403
+
+    db.query(Relic).filter(Relic.id == relic_id).delete()
+    db.commit()
+    assert client.get(f"/{relic_id}/raw").status_code == 404
+
+
+@pytest.mark.unit
+def test_raw_route_passes_gzip_through(client, monkeypatch):
+    """Test that gzip-stored content is served compressed only to clients that accept it."""
+    import gzip
+    from unittest.mock import AsyncMock
+
+    content = b"compressible line\n" * 200
+    create_response = client.post(
+        "/api/v1/relics",
+        data={"name": "Gzip Test"},
+        files={"file": ("test.txt", BytesIO(content), "text/plain")}
+    )
+    relic_id = create_response.json()["id"]
+
+    async def gzip_stream(key, chunk_size=64 * 1024, decode=True):
+        return iter([content if decode else gzip.compress(content)]), "gzip"
+
+    monkeypatch.setattr("backend.routes.relics.storage_service.stream", AsyncMock(side_effect=gzip_stream))
+
+    with client.stream("GET", f"/{relic_id}/raw", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert gzip.decompress(b"".join(response.iter_raw())) == content
+
+    for accept_encoding in ("identity", "gzip;q=0"):
+        with client.stream("GET", f"/{relic_id}/raw", headers={"Accept-Encoding": accept_encoding}) as response:
+            assert "content-encoding" not in response.headers
+            assert "Accept-Encoding" in response.headers["vary"]
+            assert b"".join(response.iter_raw()) == content
@@ -0,0 +1,102 @@
+"""Tests for the storage service compression path."""
+import gzip
+import io
+import pytest
+from minio.datatypes import Object
+from urllib3 import HTTPHeaderDict, HTTPResponse
+
+from backend.storage import StorageService, is_compressible
+
+
+class FakeMinio:
+    """Minimal in-memory stand-in for the MinIO client."""
+
+    def __init__(self):
+        self.objects = {}
+        self.content_types = {}
+
+    def put_object(self, bucket_name, object_name, data, length, content_type, metadata=None):
+        self.objects[object_name] = (data.read(), dict(metadata or {}))
+        self.content_types[object_name] = content_type
+
+    def get_object(self, bucket_name, object_name):
+        body, metadata = self.objects[object_name]
+        return HTTPResponse(body=io.BytesIO(body), headers=metadata, preload_content=False)
+
+    def stat_object(self, bucket_name, object_name):
+        body, metadata = self.objects[object_name]
+        return Object(bucket_name, object_name, size=len(body), content_type=self.content_types[object_name],
+                      metadata=HTTPHeaderDict(metadata))
+
+    def copy_object(self, bucket_name, object_name, source):
+        # Server-side copy keeps the source metadata
+        self.objects[object_name] = self.objects[source.object_name]
+        self.content_types[object_name] = self.content_types[source.object_name]
+
+    def compose_object(self, bucket_name, object_name, sources, metadata=None):
+        # Multipart compose keeps only the metadata passed in
+        metadata = dict(metadata or {})
+        self.content_types[object_name] = metadata.pop("Content-Type", "binary/octet-stream")
+        self.objects[object_name] = (b"".join(self.objects[s.object_name][0] for s in sources), metadata)
+
+
+@pytest.fixture
+def storage():
+    service = StorageService()
+    service.client = FakeMinio()
+    return service
+
+
+@pytest.mark.unit
+def test_is_compressible():
+    assert is_compressible("text/plain")
+    assert is_compressible("application/json; charset=utf-8")
+    assert not is_compressible("image/png")
+    assert not is_compressible(None)
+
+
+@pytest.mark.unit
+async def test_text_is_stored_compressed(storage):
+    content = b"line of text\n" * 500
+    await storage.upload("relics/a", content, "text/plain")
+
+    stored, metadata = storage.client.objects["relics/a"]
+    assert metadata == {"Content-Encoding": "gzip"}
+    assert gzip.decompress(stored) == content
+
+    assert await storage.download("relics/a") == content
+
+    chunks, encoding = await storage.stream("relics/a")
+    assert encoding == "gzip"
+    assert b"".join(chunks) == content
+
+    chunks, encoding = await storage.stream("relics/a", decode=False)
+    assert encoding == "gzip"
+    assert gzip.decompress(b"".join(chunks)) == content
+
+
+@pytest.mark.unit
+async def test_binary_and_small_content_stored_as_is(storage):
+    await storage.upload("relics/b", b"\x89PNG" * 1000, "image/png")
+    await storage.upload("relics/c", b"tiny", "text/plain")
+
+    assert storage.client.objects["relics/b"] == (b"\x89PNG" * 1000, {})
+    assert storage.client.objects["relics/c"] == (b"tiny", {})
+
+    chunks, encoding = await storage.stream("relics/c", decode=False)
+    assert encoding is None
+    assert b"".join(chunks) == b"tiny"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_part_size", [5 * 1024 ** 3, 16])
+async def test_copy_keeps_content_metadata(storage, monkeypatch, max_part_size):
+    monkeypatch.setattr("backend.storage.MAX_PART_SIZE", max_part_size)
+    content = b"line of text\n" * 500
+    await storage.upload("relics/src", content, "text/plain")
+
+    assert await storage.copy("relics/src", "relics/dst") == "relics/dst"
+
+    assert storage.client.content_types["relics/dst"] == "text/plain"
+    assert storage.client.objects["relics/dst"] == storage.client.objects["relics/src"]
+    assert await storage.download("relics/dst") == content
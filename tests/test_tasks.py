@@ -0,0 +1,34 @@
+"""Tests for background tasks."""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from backend.models import Relic
+from backend.tasks import cleanup_expired_relics
+
+
+@pytest.mark.unit
+async def test_cleanup_expired_relics(db, monkeypatch):
+    """Expired relics are removed from storage and the database; failures are kept for retry."""
+    past = datetime.utcnow() - timedelta(days=1)
+    db.add_all([
+        Relic(id="a" * 32, s3_key="relics/a", expires_at=past),
+        Relic(id="b" * 32, s3_key="relics/b", expires_at=past),
+        Relic(id="c" * 32, s3_key="relics/c", expires_at=past),
+        Relic(id="d" * 32, s3_key="relics/d", expires_at=datetime.utcnow() + timedelta(days=1)),
+        Relic(id="e" * 32, s3_key="relics/e"),
+    ])
+    db.commit()
+
+    async def fake_delete(key):
+        if key == "relics/c":
+            raise Exception("storage unavailable")
+
+    monkeypatch.setattr("backend.tasks.SessionLocal", lambda: db)
+    monkeypatch.setattr("backend.tasks.settings.RELIC_CLEANUP_BATCH_SIZE", 2)  # force several batches
+    with patch("backend.tasks.storage_service.delete", AsyncMock(side_effect=fake_delete)) as mock_delete:
+        await cleanup_expired_relics()
+
+    assert sorted(call.args[0] for call in mock_delete.call_args_list) == ["relics/a", "relics/b", "relics/c"]
+    remaining = sorted(r.id for r in db.query(Relic).all())
+    assert remaining == ["c" * 32, "d" * 32, "e" * 32]
@@ -1,81 +1,94 @@
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime
 from backend.models import Relic, ClientKey
 from backend.utils import generate_relic_id
 
-@pytest.mark.unit
-def test_update_relic_permissions(client, db):
-    """Test that only owner or admin can update relic."""
-    # 1. Create a relic owned by client A
-    client_a_id = "aaaa" * 8
-    client_a = ClientKey(id=client_a_id, name="Client A")
-    db.add(client_a)
-
-    relic_id = generate_relic_id()
-    relic = Relic(
-        id=relic_id,
-        client_id=client_a_id,
-        name="Original Name",
-        content_type="text/plain",
-        access_level="public",
-        created_at=datetime.utcnow(),
-        size_bytes=100
-    )
-    db.add(relic)
-    db.commit()
+FROZEN_NOW = datetime(2025, 1, 1)
+
+CLIENT_A_ID = "aaaa" * 8
+CLIENT_B_ID = "bbbb" * 8
+
 
-    # 2. Try to update as anonymous (should fail)
-    resp = client.put(f"/api/v1/relics/{relic_id}", json={"name": "New Name"})
-    assert resp.status_code == 401
+class FrozenDatetime(datetime):
+    """datetime whose utcnow() always returns FROZEN_NOW."""
 
-    # 3. Try to update as client B (should fail)
-    client_b_id = "bbbb" * 8
-    client_b = ClientKey(id=client_b_id, name="Client B")
-    db.add(client_b)
+    @classmethod
+    def utcnow(cls):
+        return FROZEN_NOW
+
+
+@pytest.fixture(scope="module")
+def relic_ids():
+    """Relic ids generated once for the module (each test's rows are rolled back)."""
+    return [generate_relic_id() for _ in range(3)]
+
+
+@pytest.fixture(scope="module")
+def admin_id():
+    """Register an admin client id in settings for the rest of the module."""
+    admin_id = "dddd" * 8
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("backend.config.settings.ADMIN_CLIENT_IDS", admin_id)
+        yield admin_id
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Freeze the clock used for expiry calculations."""
+    monkeypatch.setattr("backend.utils.datetime", FrozenDatetime)
+    return FROZEN_NOW
+
+
+@pytest.fixture
+def owned_relic(db, make_relic, relic_ids):
+    """Create a relic owned by client A, with client B registered as a non-owner."""
+    relic = make_relic(CLIENT_A_ID, id=relic_ids[0], name="Original Name")
+    db.add_all([
+        ClientKey(id=CLIENT_A_ID, name="Client A"),
+        ClientKey(id=CLIENT_B_ID, name="Client B"),
+        relic,
+    ])
     db.commit()
+    return relic.id
 
-    resp = client.put(
-        f"/api/v1/relics/{relic_id}",
-        json={"name": "New Name"},
-        headers={"X-Client-Key": client_b_id}
-    )
-    assert resp.status_code == 403
 
-    # 4. Update as client A (should succeed)
+@pytest.mark.unit
+@pytest.mark.parametrize("client_key, expected_status", [
+    (None, 401),         # anonymous
+    (CLIENT_B_ID, 403),  # another client
+    (CLIENT_A_ID, 200),  # owner
+])
+def test_update_relic_permissions(client, db, owned_relic, client_key, expected_status):
+    """Test that only owner or admin can update relic."""
+    headers = {"X-Client-Key": client_key} if client_key else {}
     resp = client.put(
-        f"/api/v1/relics/{relic_id}",
+        f"/api/v1/relics/{owned_relic}",
         json={"name": "Updated Name"},
-        headers={"X-Client-Key": client_a_id}
+        headers=headers
     )
-    assert resp.status_code == 200
-    assert resp.json()["name"] == "Updated Name"
-    assert resp.json()["can_edit"] is True
+    assert resp.status_code == expected_status
 
     # Verify DB
-    relic = db.query(Relic).filter(Relic.id == relic_id).first()
-    assert relic.name == "Updated Name"
+    relic = db.query(Relic).filter(Relic.id == owned_relic).first()
+    if expected_status == 200:
+        assert resp.json()["name"] == "Updated Name"
+        assert resp.json()["can_edit"] is True
+        assert relic.name == "Updated Name"
+    else:
+        assert relic.name == "Original Name"
 
 
 @pytest.mark.unit
-def test_update_relic_fields(client, db):
+@pytest.mark.usefixtures("frozen_time")
+def test_update_relic_fields(client, db, make_relic, relic_ids):
     """Test updating various fields of a relic."""
     client_id = "cccc" * 8
     owner = ClientKey(id=client_id, name="Client C")
-    db.add(owner)
-
-    relic_id = generate_relic_id()
-
-    relic = Relic(
-        id=relic_id,
-        client_id=client_id,
-        name="Old Name",
-        content_type="text/plain",
-        access_level="public",
-        created_at=datetime.utcnow(),
-        size_bytes=200
-    )
-    db.add(relic)
+
+    relic_id = relic_ids[1]
+    relic = make_relic(client_id, id=relic_id, name="Old Name", size_bytes=200)
+    db.add_all([owner, relic])
     db.commit()
 
     # Update name, content_type, access_level, expires_in
@@ -97,38 +110,21 @@ def test_update_relic_fields(client, db):
     assert data["name"] == "New Name"
     assert data["content_type"] == "text/markdown"
     assert data["access_level"] == "private"
-    assert data["expires_at"] is not None
-
-    # Verify expiration logic roughly
-    expiry = datetime.fromisoformat(data["expires_at"])
-    now = datetime.utcnow()
-    assert now < expiry < now + timedelta(hours=2)
+    assert data["expires_at"] == "2025-01-01T01:00:00"
 
 
 @pytest.mark.unit
-def test_admin_update_relic(client, db, monkeypatch):
+def test_admin_update_relic(client, db, make_relic, admin_id, relic_ids):
     """Test that admin can update any relic."""
-    # Mock admin settings
-    admin_id = "dddd" * 8
-    monkeypatch.setattr("backend.config.settings.ADMIN_CLIENT_IDS", admin_id)
 
     # Create admin client
     admin_client = ClientKey(id=admin_id, name="Admin")
-    db.add(admin_client)
 
     # Create relic owned by someone else
     other_id = "eeee" * 8
-    relic_id = generate_relic_id()
-    relic = Relic(
-        id=relic_id,
-        client_id=other_id,
-        name="User Relic",
-        created_at=datetime.utcnow(),
-        content_type="text/plain",
-        size_bytes=300,
-        access_level="public"
-    )
-    db.add(relic)
+    relic_id = relic_ids[2]
+    relic = make_relic(other_id, id=relic_id, name="User Relic", size_bytes=300)
+    db.add_all([admin_client, relic])
     db.commit()
 
     # Admin updates it
@@ -1,6 +1,6 @@
 import pytest
 from datetime import datetime
-from backend.utils import parse_expiry_string
+from backend.utils import parse_expiry_string, generate_relic_id, hash_password, verify_password, accepts_gzip
 
 @pytest.mark.unit
 def test_parse_expiry_string_minutes():
@@ -56,3 +56,35 @@ def test_parse_expiry_string_invalid():
     assert parse_expiry_string("invalid") is None
     assert parse_expiry_string("10x") is None
     assert parse_expiry_string("abc") is None
+
+
+@pytest.mark.unit
+def test_generate_relic_id_format():
+    relic_id = generate_relic_id()
+    assert len(relic_id) == 32
+    assert int(relic_id, 16) >= 0
+    assert relic_id == relic_id.lower()
+    assert generate_relic_id() != relic_id
+
+@pytest.mark.unit
+def test_hash_and_verify_password():
+    import hashlib
+    password_hash = hash_password("secret123")
+    assert password_hash != hash_password("secret123")  # salted
+    assert verify_password("secret123", password_hash)
+    assert not verify_password("wrong", password_hash)
+    # Legacy unsalted SHA256 hashes still verify
+    legacy = hashlib.sha256(b"secret123").hexdigest()
+    assert verify_password("secret123", legacy)
+    assert not verify_password("wrong", legacy)
+
+@pytest.mark.unit
+def test_accepts_gzip_honours_q_values():
+    assert accepts_gzip("gzip")
+    assert accepts_gzip("br, GZIP;q=0.5")
+    assert accepts_gzip("*")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("gzip; q=0.000, *")
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip("")
+    assert not accepts_gzip(None)